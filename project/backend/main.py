@@ -4,20 +4,26 @@ Integrates multiple APIs for comprehensive content analysis.
 """
 
 import os
-import json
+import operator
+import re
 import asyncio
+import hashlib
 import aiohttp
+import orjson
 import urllib.parse
 from typing import List, Optional, Dict, Any
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, HttpUrl
+from cachetools import TTLCache
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dotenv import load_dotenv  # <-- add this import
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 # Load environment variables from .env file
 load_dotenv()  # <-- add this line
@@ -25,25 +31,61 @@ load_dotenv()  # <-- add this line
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Route root log records through a queue so handler I/O runs off the event loop"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+def stop_log_listener(listener: logging.handlers.QueueListener):
+    """Flush queued log records and restore the original handlers"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+# Timestamp served by the status endpoints, refreshed once per second while running
+_now_iso = datetime.now().isoformat()
+
+async def refresh_clock():
+    """Keep _now_iso current so status endpoints don't format a timestamp per hit"""
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(1)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    log_listener = start_log_listener()
     logger.info("Fake News Detector API starting up")
+    clock_task = asyncio.create_task(refresh_clock())
+    # Build the connection pool up front so the first request doesn't pay for it
+    await analyzer.get_session()
     yield
+    clock_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await clock_task
     await analyzer.close_session()
     logger.info("Fake News Detector API shutting down")
+    stop_log_listener(log_listener)
 
 app = FastAPI(
     title="Fake News Detector API",
     description="API for analyzing news content credibility with multiple AI services",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Custom error handler for invalid JSON
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    logger.error(f"Request validation error: {exc}")
+    logger.error("Request validation error: %s", exc)
     return JSONResponse(
         status_code=422,
         content={
@@ -67,16 +109,55 @@ FACTCHECK_KEY = os.getenv("FACTCHECK_KEY", "")
 HUGGINGFACE_TOKEN = os.getenv("HUGGINGFACE_TOKEN", "")
 GEMINI_KEY = os.getenv("GEMINI_KEY", "")
 
-# Log loaded keys for debugging
-logger.info(f"SERPAPI_KEY: {SERPAPI_KEY}")
-logger.info(f"FACTCHECK_KEY: {FACTCHECK_KEY}")
-logger.info(f"HUGGINGFACE_TOKEN: {HUGGINGFACE_TOKEN}")
-logger.info(f"GEMINI_KEY: {GEMINI_KEY}")
+# Skip HuggingFace/Gemini when a known fact-checker has a definitive rating
+FAST_PATH_ENABLED = os.getenv("FAST_PATH_ENABLED", "true").lower() in ("1", "true", "yes")
+# Normalised textualRating -> whether the claim was rated true
+DEFINITIVE_RATINGS = {
+    'false': False,
+    'mostly false': False,
+    'pants on fire': False,
+    'true': True,
+    'mostly true': True
+}
 
 # Request timeout settings
 API_TIMEOUT = 8.0
+FANOUT_TIMEOUT = API_TIMEOUT + 2
 TOTAL_TIMEOUT = 20.0
 
+# Upstream API endpoints; query parameters are passed separately
+_SERP_URL = "https://serpapi.com/search.json"
+_FC_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+_HF_URL = "https://router.huggingface.co/hf-inference/models/mrm8488/bert-tiny-finetuned-fake-news-detection"
+_GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+
+# Gemini response cleanup patterns
+_MD_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.MULTILINE)
+_GEMINI_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Static parts of the Gemini prompt; the INPUT object is serialized per request
+_GEMINI_PROMPT_PREFIX = (
+    "INSTRUCTIONS: You are a fact-check assistant. Use only the input data to produce "
+    "ONE valid JSON object and NOTHING ELSE. Return only JSON with keys: credibility_score, "
+    "label, explanation, sources. INPUT: "
+)
+_GEMINI_PROMPT_SUFFIX = (
+    ". TASK: 1) compute credibility_score (0-100), 2) pick label (Fake/Real/Uncertain), "
+    "3) short explanation (1-2 sentences) referencing which sources influenced the decision, "
+    "4) return sources array (title,url,snippet)."
+)
+
+# Legacy endpoint label decoration and evidence link fields
+_LABEL_EMOJI = {'Real': '✅', 'Uncertain': '⚠️', 'Fake': '❌'}
+_SOURCE_FIELDS = operator.attrgetter('title', 'url', 'snippet')
+
+# Analysis result cache settings
+CACHE_MAXSIZE = 2048
+CACHE_TTL = 3600
+
+# Maximum characters sent to the HuggingFace model
+HF_MAX_CHARS = 1000
+
 class AnalyzeRequest(BaseModel):
     text: str
     url: str
@@ -92,21 +173,125 @@ class AnalyzeResponse(BaseModel):
     explanation: str
     sources: List[Source]
 
+def compute_credibility_score(
+    fc_false: bool,
+    fc_true: bool,
+    fc_mixed: bool,
+    hf_is_fake: bool,
+    hf_is_real: bool,
+    hf_score: float,
+    reputable_count: int,
+    total_sources: int
+) -> int:
+    """Numeric scoring used by the local merge, clamped to 0-100"""
+    score = 50  # Base score
+    
+    # Fact-check adjustments
+    if fc_false:
+        score -= 40
+    elif fc_true:
+        score += 30
+    elif fc_mixed:
+        score -= 10
+    
+    # HuggingFace adjustments
+    if hf_is_fake:
+        score -= round(hf_score * 40)
+    elif hf_is_real:
+        score += round(hf_score * 20)
+    
+    # Source reputation adjustments
+    if reputable_count > 0:
+        score += min(reputable_count * 8, 24)
+    elif total_sources > 2:
+        score -= 5
+    
+    return max(0, min(100, score))
+
+def host_in_domains(url: str, domains: frozenset) -> bool:
+    """Check whether a URL's host is one of domains or a subdomain of one"""
+    try:
+        host = urllib.parse.urlsplit(url).hostname or ''
+    except ValueError:
+        return False
+    host = host.removeprefix('www.')
+    return host in domains or any(host.endswith('.' + domain) for domain in domains)
+
+async def run_step(name: str, coro, default: Any) -> Any:
+    """Await one workflow step, returning default if it raises so sibling steps keep running"""
+    try:
+        return await coro
+    except Exception as e:
+        logger.error("%s step failed: %s", name, e)
+        return default
+
+def task_result(task: asyncio.Task, default: Any) -> Any:
+    """Result of a finished task, or default if it failed or was cancelled"""
+    if task.done() and not task.cancelled() and task.exception() is None:
+        return task.result()
+    return default
+
 class FakeNewsAnalyzer:
     """Multi-API fake news analyzer following exact workflow specification"""
     
     def __init__(self):
         self.session = None
-        self.reputable_domains = {
-            'reuters.com', 'bbc.com', 'ap.org', 'nytimes.com', 
-            'guardian', 'washingtonpost', 'wsj.com'
+        self.reputable_hosts = frozenset({
+            'reuters.com', 'bbc.com', 'apnews.com', 'ap.org', 'nytimes.com',
+            'theguardian.com', 'washingtonpost.com', 'wsj.com'
+        })
+        self.fact_check_reviewers = frozenset({
+            'snopes.com', 'politifact.com', 'factcheck.org', 'fullfact.org',
+            'afp.com', 'apnews.com', 'reuters.com', 'usatoday.com',
+            'washingtonpost.com', 'leadstories.com'
+        })
+        # Cap in-flight requests per upstream so a slow API can't starve the others
+        self.semaphores = {
+            'serpapi': asyncio.Semaphore(20),
+            'factcheck': asyncio.Semaphore(20),
+            'huggingface': asyncio.Semaphore(10),
+            'gemini': asyncio.Semaphore(10)
         }
+        # Completed analyses keyed by text hash, so repeated submissions
+        # from the extension skip the upstream APIs
+        self.result_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+        # HuggingFace (label, score) keyed by hash of the submitted prefix
+        self.hf_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+    
+    def is_reputable_source(self, url: str) -> bool:
+        """Check whether a URL's host is (a subdomain of) a reputable outlet"""
+        return host_in_domains(url, self.reputable_hosts)
+    
+    def is_definitive_fact_check(self, fact_check_summary: Optional[Dict]) -> bool:
+        """Check whether a fact-check is a clear rating from a known fact-checker"""
+        if not fact_check_summary:
+            return False
+        # Exact match only; ratings like "Half True" or free-text verdicts go to Gemini
+        rating = (fact_check_summary.get('rating') or '').strip().lower()
+        if rating not in DEFINITIVE_RATINGS:
+            return False
+        return host_in_domains(fact_check_summary.get('url', ''), self.fact_check_reviewers)
     
     async def get_session(self):
         """Get or create aiohttp session"""
         if self.session is None:
-            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=API_TIMEOUT,
+                connect=2.0,
+                sock_read=API_TIMEOUT
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"Accept-Encoding": "gzip, deflate"}
+            )
         return self.session
     
     async def close_session(self):
@@ -119,33 +304,66 @@ class FakeNewsAnalyzer:
         """
         Main analysis workflow following exact specification
         """
+        cache_key = hashlib.blake2b(text[:2000].encode(), digest_size=16).digest()
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached analysis result")
+            return cached
+        
         try:
             session = await self.get_session()
             
-            # Step 1: SerpAPI Google News search
-            sources = await self.search_news_sources(session, text)
-            
-            # Step 2: Google Fact Check Tools
-            fact_check_summary = await self.check_fact_check_tools(session, text)
+            # Steps 1-3 are independent, so run SerpAPI, Fact Check Tools
+            # and Hugging Face concurrently under their own time budget,
+            # leaving the rest of TOTAL_TIMEOUT for Gemini
+            try:
+                async with asyncio.timeout(FANOUT_TIMEOUT):
+                    async with asyncio.TaskGroup() as tg:
+                        sources_task = tg.create_task(run_step(
+                            "SerpAPI", self.search_news_sources(session, text), []
+                        ))
+                        fact_check_task = tg.create_task(run_step(
+                            "Fact Check", self.check_fact_check_tools(session, text), None
+                        ))
+                        hf_task = tg.create_task(run_step(
+                            "HuggingFace", self.analyze_with_huggingface(session, text), ("Uncertain", 0.5)
+                        ))
+                        if FAST_PATH_ENABLED:
+                            # Fact Check is usually the fastest API; a definitive
+                            # rating makes the HuggingFace result unnecessary
+                            await asyncio.wait({fact_check_task})
+                            if self.is_definitive_fact_check(task_result(fact_check_task, None)):
+                                hf_task.cancel()
+            except TimeoutError:
+                logger.error("Upstream lookups timed out after %ss", FANOUT_TIMEOUT)
             
-            # Step 3: Hugging Face Inference API
-            hf_label, hf_score = await self.analyze_with_huggingface(session, text)
+            sources = task_result(sources_task, [])
+            fact_check_summary = task_result(fact_check_task, None)
+            hf_label, hf_score = task_result(hf_task, ("Uncertain", 0.5))
             
-            # Step 4: Gemini final reasoning
-            try:
+            # Step 4: Gemini final reasoning, skipped on the fast path where a
+            # definitive fact-check decides the verdict locally
+            if FAST_PATH_ENABLED and self.is_definitive_fact_check(fact_check_summary):
+                logger.info("Definitive fact-check rating, skipping Gemini")
+                result = self.fallback_local_merge(
+                    text, sources, fact_check_summary, hf_label, hf_score
+                )
+            else:
                 result = await self.get_gemini_analysis(
                     session, text, sources, fact_check_summary, hf_label, hf_score
                 )
-                return result
-            except Exception as e:
-                logger.error(f"Gemini analysis failed: {e}")
-                # Fallback to local merge
-                return self.fallback_local_merge(
-                    text, sources, fact_check_summary, hf_label, hf_score
-                )
+                if result is None:
+                    # Fallback to local merge; not cached, since it may reflect
+                    # a transient upstream failure
+                    return self.fallback_local_merge(
+                        text, sources, fact_check_summary, hf_label, hf_score
+                    )
+            
+            self.result_cache[cache_key] = result
+            return result
                 
         except Exception as e:
-            logger.error(f"Analysis failed: {e}")
+            logger.error("Analysis failed: %s", e)
             # Return fallback response
             return AnalyzeResponse(
                 credibility_score=50,
@@ -157,48 +375,59 @@ class FakeNewsAnalyzer:
     async def search_news_sources(self, session: aiohttp.ClientSession, text: str) -> List[Source]:
         """Step 1: SerpAPI Google News search"""
         try:
-            encoded_text = urllib.parse.quote(text[:200])  # Limit query length
-            url = f"https://serpapi.com/search.json?q={encoded_text}&tbm=nws&num=5&api_key={SERPAPI_KEY}"
+            params = {
+                'q': text[:200],  # Limit query length
+                'tbm': 'nws',
+                'num': 5,
+                'api_key': SERPAPI_KEY
+            }
             
-            async with session.get(url) as response:
+            async with self.semaphores['serpapi'], session.get(_SERP_URL, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads, content_type=None)
                     news_results = data.get('news_results', [])
                     
                     sources = []
                     for item in news_results[:5]:
-                        sources.append(Source(
-                            title=item.get('title', ''),
-                            url=item.get('link', ''),
-                            snippet=item.get('snippet', '')
+                        # Skip validation; null fields are normalised to empty strings
+                        sources.append(Source.model_construct(
+                            title=item.get('title') or '',
+                            url=item.get('link') or '',
+                            snippet=item.get('snippet') or ''
                         ))
                     
-                    logger.info(f"SerpAPI found {len(sources)} sources")
+                    logger.info("SerpAPI found %d sources", len(sources))
                     return sources
                 else:
-                    logger.warning(f"SerpAPI failed with status {response.status}")
+                    logger.warning("SerpAPI failed with status %s", response.status)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("SerpAPI error response body: %s", await response.text())
                     return []
                     
-        except Exception as e:
-            logger.error(f"SerpAPI search failed: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("SerpAPI search failed: %s", e)
             return []
     
     async def check_fact_check_tools(self, session: aiohttp.ClientSession, text: str) -> Optional[Dict]:
         """Step 2: Google Fact Check Tools"""
+        if not FACTCHECK_KEY:
+            logger.warning("FACTCHECK_KEY not provided")
+            return None
+        
         try:
-            if not FACTCHECK_KEY:
-                logger.warning("FACTCHECK_KEY not provided")
-                return None
-                
-            encoded_text = urllib.parse.quote(text[:200])
-            url = f"https://factchecktools.googleapis.com/v1alpha1/claims:search?query={encoded_text}&languageCode=en&pageSize=3&key={FACTCHECK_KEY}"
+            params = {
+                'query': text[:200],
+                'languageCode': 'en',
+                'pageSize': 3,
+                'key': FACTCHECK_KEY
+            }
             
-            async with session.get(url) as response:
-                logger.info(f"Fact Check Tools response status: {response.status}")
-                data = await response.text()
-                logger.info(f"Fact Check Tools response body: {data}")
+            async with self.semaphores['factcheck'], session.get(_FC_URL, params=params) as response:
+                logger.info("Fact Check Tools response status: %s", response.status)
                 if response.status == 200:
-                    data = json.loads(data)
+                    data = await response.json(loads=orjson.loads, content_type=None)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Fact Check Tools response body: %s", data)
                     claims = data.get('claims', [])
                     
                     if claims and len(claims) > 0:
@@ -214,29 +443,40 @@ class FakeNewsAnalyzer:
                     logger.info("No fact-check claims found")
                     return None
                 else:
-                    logger.warning(f"Fact Check Tools failed with status {response.status}")
+                    logger.warning("Fact Check Tools failed with status %s", response.status)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Fact Check Tools error response body: %s", await response.text())
                     return None
                     
-        except Exception as e:
-            logger.error(f"Fact Check Tools failed: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("Fact Check Tools failed: %s", e)
             return None
     
     async def analyze_with_huggingface(self, session: aiohttp.ClientSession, text: str) -> tuple[str, float]:
         """Step 3: Hugging Face Inference API"""
+        # Limit text length, cutting at a word boundary so near-identical
+        # submissions produce the same input
+        hf_text = text[:HF_MAX_CHARS]
+        if len(text) > HF_MAX_CHARS:
+            hf_text = hf_text.rsplit(' ', 1)[0]
+        cache_key = hashlib.blake2b(hf_text.encode(), digest_size=16).digest()
+        cached = self.hf_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            url = "https://router.huggingface.co/hf-inference/models/mrm8488/bert-tiny-finetuned-fake-news-detection"
             headers = {
                 "Authorization": f"Bearer {HUGGINGFACE_TOKEN}",
                 "Content-Type": "application/json"
             }
-            payload = {"inputs": text[:1000]}  # Limit text length
+            payload = {"inputs": hf_text}
             
-            async with session.post(url, headers=headers, json=payload) as response:
-                logger.info(f"HuggingFace response status: {response.status}")
-                data = await response.text()
-                logger.info(f"HuggingFace response body: {data}")
+            async with self.semaphores['huggingface'], session.post(_HF_URL, headers=headers, json=payload) as response:
+                logger.info("HuggingFace response status: %s", response.status)
                 if response.status == 200:
-                    data = json.loads(data)
+                    data = await response.json(loads=orjson.loads, content_type=None)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("HuggingFace response body: %s", data)
                     
                     # Parse HF response format
                     if isinstance(data, list) and len(data) > 0:
@@ -255,17 +495,20 @@ class FakeNewsAnalyzer:
                             else:
                                 normalized_label = "Uncertain"
                             
-                            logger.info(f"HuggingFace: {normalized_label} ({score:.2f})")
+                            logger.info("HuggingFace: %s (%.2f)", normalized_label, score)
+                            self.hf_cache[cache_key] = (normalized_label, float(score))
                             return normalized_label, float(score)
                     
                     logger.warning("Unexpected HuggingFace response format")
                     return "Uncertain", 0.5
                 else:
-                    logger.warning(f"HuggingFace failed with status {response.status}")
+                    logger.warning("HuggingFace failed with status %s", response.status)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("HuggingFace error response body: %s", await response.text())
                     return "Uncertain", 0.5
                     
-        except Exception as e:
-            logger.error(f"HuggingFace analysis failed: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("HuggingFace analysis failed: %s", e)
             return "Uncertain", 0.5
     
     async def get_gemini_analysis(
@@ -276,17 +519,23 @@ class FakeNewsAnalyzer:
         fact_check_summary: Optional[Dict], 
         hf_label: str, 
         hf_score: float
-    ) -> AnalyzeResponse:
-        """Step 4: Gemini final reasoning and JSON generation"""
+    ) -> Optional[AnalyzeResponse]:
+        """Step 4: Gemini final reasoning and JSON generation, None if it fails"""
         
         # Prepare data for Gemini
         sources_json = [{"title": s.title, "url": s.url, "snippet": s.snippet} for s in sources]
         fact_check_json = fact_check_summary if fact_check_summary else None
         
-        prompt = f"""INSTRUCTIONS: You are a fact-check assistant. Use only the input data to produce ONE valid JSON object and NOTHING ELSE. Return only JSON with keys: credibility_score, label, explanation, sources. INPUT: {{"text":"{text[:500]}", "sources":{json.dumps(sources_json)}, "fact_check":{json.dumps(fact_check_json)}, "hf_label":"{hf_label}", "hf_score":{hf_score}}}. TASK: 1) compute credibility_score (0-100), 2) pick label (Fake/Real/Uncertain), 3) short explanation (1-2 sentences) referencing which sources influenced the decision, 4) return sources array (title,url,snippet)."""
+        input_obj = {
+            "text": text[:500],
+            "sources": sources_json,
+            "fact_check": fact_check_json,
+            "hf_label": hf_label,
+            "hf_score": hf_score
+        }
+        prompt = _GEMINI_PROMPT_PREFIX + orjson.dumps(input_obj).decode() + _GEMINI_PROMPT_SUFFIX
         
         try:
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={GEMINI_KEY}"
             headers = {"Content-Type": "application/json"}
             payload = {
                 "contents": [
@@ -301,12 +550,14 @@ class FakeNewsAnalyzer:
                 # REMOVE temperature and maxOutputTokens
             }
             
-            async with session.post(url, headers=headers, json=payload) as response:
-                logger.info(f"Gemini response status: {response.status}")
-                data = await response.text()
-                logger.info(f"Gemini response body: {data}")
+            async with self.semaphores['gemini'], session.post(
+                _GEMINI_URL, params={'key': GEMINI_KEY}, headers=headers, json=payload
+            ) as response:
+                logger.info("Gemini response status: %s", response.status)
                 if response.status == 200:
-                    data = json.loads(data)
+                    data = await response.json(loads=orjson.loads, content_type=None)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Gemini response body: %s", data)
                     
                     # Extract text from Gemini response
                     candidates = data.get('candidates', [])
@@ -317,32 +568,25 @@ class FakeNewsAnalyzer:
                             response_text = parts[0].get('text', '')
                             
                             # Robustly extract JSON from response
-                            import re
-                            clean_text = response_text.strip()
                             # Remove markdown code block if present
-                            if clean_text.startswith('```json'):
-                                clean_text = clean_text[7:]
-                            if clean_text.startswith('```'):
-                                clean_text = clean_text[3:]
-                            if clean_text.endswith('```'):
-                                clean_text = clean_text[:-3]
-                            clean_text = clean_text.strip()
+                            clean_text = _MD_FENCE_RE.sub('', response_text.strip()).strip()
                             # Try to extract JSON object using regex if extra text is present
-                            match = re.search(r'(\{.*\})', clean_text, re.DOTALL)
+                            match = _GEMINI_JSON_RE.search(clean_text)
                             if match:
-                                clean_text = match.group(1)
+                                clean_text = match.group(0)
                             try:
-                                result_json = json.loads(clean_text)
+                                result_json = orjson.loads(clean_text)
                                 # Validate required keys
                                 required_keys = ['credibility_score', 'label', 'explanation', 'sources']
                                 if all(key in result_json for key in required_keys):
                                     # Convert sources to Source objects
                                     sources_list = []
                                     for src in result_json['sources']:
-                                        sources_list.append(Source(
-                                            title=src.get('title', ''),
-                                            url=src.get('url', ''),
-                                            snippet=src.get('snippet', '')
+                                        # Coerce instead of validating; model_construct instances aren't re-validated
+                                        sources_list.append(Source.model_construct(
+                                            title=str(src.get('title') or ''),
+                                            url=str(src.get('url') or ''),
+                                            snippet=str(src.get('snippet') or '')
                                         ))
                                     
                                     return AnalyzeResponse(
@@ -353,15 +597,21 @@ class FakeNewsAnalyzer:
                                     )
                                 else:
                                     logger.warning("Gemini response missing required keys")
-                            except Exception as e:
-                                logger.warning(f"Failed to parse Gemini JSON: {e}")
+                            except (ValueError, TypeError, AttributeError) as e:
+                                logger.warning("Failed to parse Gemini JSON: %s", e)
+                elif logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Gemini error response body: %s", await response.text())
                 
                 logger.warning("Invalid Gemini response format")
-                raise Exception("Invalid Gemini response")
+                return None
                 
-        except Exception as e:
-            logger.error(f"Gemini API failed: {e}")
-            raise e
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("Gemini API failed: %s", e)
+            return None
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
+            # Unexpected payload shape; let the caller fall back to the local merge
+            logger.error("Malformed Gemini response: %s", e)
+            return None
     
     def fallback_local_merge(
         self, 
@@ -373,49 +623,49 @@ class FakeNewsAnalyzer:
     ) -> AnalyzeResponse:
         """Fallback local merge when Gemini fails"""
         
-        score = 50  # Base score
         explanation_parts = []
+        fc_false = fc_true = fc_mixed = False
         
-        # Apply fact-check adjustments
+        # Classify fact-check rating
         if fact_check_summary:
-            rating = fact_check_summary.get('rating', '').lower()
-            if 'false' in rating:
-                score -= 40
+            rating = (fact_check_summary.get('rating') or '').strip().lower()
+            verdict = DEFINITIVE_RATINGS.get(rating)
+            if verdict is False or (verdict is None and 'false' in rating):
+                fc_false = True
                 explanation_parts.append("fact-checkers found false claims")
-            elif any(term in rating for term in ['true', 'mostly true']):
-                score += 30
+            elif verdict is True or any(term in rating for term in ['true', 'mostly true']):
+                fc_true = True
                 explanation_parts.append("fact-checkers verified claims")
             elif any(term in rating for term in ['mixture', 'misleading']):
-                score -= 10
+                fc_mixed = True
                 explanation_parts.append("fact-checkers found mixed accuracy")
         
-        # Apply HuggingFace adjustments
-        if hf_label == "Fake":
-            adjustment = round(hf_score * 40)
-            score -= adjustment
+        # Classify HuggingFace result
+        hf_is_fake = hf_label == "Fake"
+        hf_is_real = hf_label == "Real"
+        if hf_is_fake:
             explanation_parts.append(f"AI model detected fake content (confidence: {hf_score:.1f})")
-        elif hf_label == "Real":
-            adjustment = round(hf_score * 20)
-            score += adjustment
+        elif hf_is_real:
             explanation_parts.append(f"AI model verified content (confidence: {hf_score:.1f})")
         
-        # Apply source reputation adjustments
+        # Count reputable sources
         reputable_count = 0
         for source in sources:
-            if any(domain in source.url.lower() for domain in self.reputable_domains):
+            if self.is_reputable_source(source.url):
                 reputable_count += 1
         
         if reputable_count > 0:
-            reputation_bonus = min(reputable_count * 8, 24)
-            score += reputation_bonus
             explanation_parts.append(f"found {reputable_count} reputable source(s)")
         elif len(sources) > 2:
-            score -= 5
             explanation_parts.append("sources are from less established outlets")
         
-        # Clamp score and determine label
-        score = max(0, min(100, score))
+        score = compute_credibility_score(
+            fc_false, fc_true, fc_mixed,
+            hf_is_fake, hf_is_real, hf_score,
+            reputable_count, len(sources)
+        )
         
+        # Determine label
         if score >= 70:
             label = "Real"
         elif score >= 40:
@@ -429,7 +679,8 @@ class FakeNewsAnalyzer:
         else:
             explanation = "Limited data available for comprehensive analysis."
         
-        return AnalyzeResponse(
+        # All fields are computed locally, so skip validation
+        return AnalyzeResponse.model_construct(
             credibility_score=score,
             label=label,
             explanation=explanation,
@@ -439,13 +690,27 @@ class FakeNewsAnalyzer:
 # Initialize analyzer
 analyzer = FakeNewsAnalyzer()
 
+async def run_analysis(text: str, url: str) -> AnalyzeResponse:
+    """Run the analyzer within TOTAL_TIMEOUT, returning an Uncertain result on timeout"""
+    try:
+        async with asyncio.timeout(TOTAL_TIMEOUT):
+            return await analyzer.analyze_content(text, url)
+    except TimeoutError:
+        logger.error("Analysis timed out")
+        return AnalyzeResponse(
+            credibility_score=50,
+            label="Uncertain",
+            explanation="Analysis timed out. Unable to complete verification within time limit.",
+            sources=[]
+        )
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
     return {
         "message": "Fake News Detector API v2.0",
         "status": "active",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso,
         "endpoints": {
             "analyze": "/api/fakenews/analyze",
             "health": "/health"
@@ -465,7 +730,7 @@ async def analyze_fake_news(request: AnalyzeRequest):
     """
     try:
         # Log incoming request for debugging
-        logger.info(f"Received analysis request: text='{request.text[:100]}', url='{request.url}'")
+        logger.info("Received analysis request: text='%.100s', url='%s'", request.text, request.url)
         
         # Validate input
         if not request.text.strip():
@@ -476,26 +741,12 @@ async def analyze_fake_news(request: AnalyzeRequest):
             raise HTTPException(status_code=400, detail="Text too short for analysis")
         
         # Run analysis with timeout
-        try:
-            result = await asyncio.wait_for(
-                analyzer.analyze_content(request.text, request.url),
-                timeout=TOTAL_TIMEOUT
-            )
-            return result
-            
-        except asyncio.TimeoutError:
-            logger.error("Analysis timed out")
-            return AnalyzeResponse(
-                credibility_score=50,
-                label="Uncertain",
-                explanation="Analysis timed out. Unable to complete verification within time limit.",
-                sources=[]
-            )
+        return await run_analysis(request.text, request.url)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error in analyze endpoint: {e}")
+        logger.error("Unexpected error in analyze endpoint: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error during analysis"
@@ -508,7 +759,7 @@ async def health_check():
         "status": "healthy",
         "service": "Fake News Detector API",
         "version": "2.0.0",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso,
         "apis": {
             "serpapi": "configured" if SERPAPI_KEY else "missing_key",
             "factcheck": "configured" if FACTCHECK_KEY else "missing_key",
@@ -529,15 +780,11 @@ async def analyze_legacy(request: dict):
             raise HTTPException(status_code=400, detail="Text cannot be empty")
         if len(content) < 50:
             raise HTTPException(status_code=400, detail="Text too short for analysis")
-        analyze_request = AnalyzeRequest(
-            text=content,
-            url=url
-        )
-        result = await analyze_fake_news(analyze_request)
+        result = await run_analysis(content, url)
         # Convert to old format for compatibility
         return {
             "score": result.credibility_score,
-            "label": f"{result.label} {'✅' if result.label == 'Real' else '⚠️' if result.label == 'Uncertain' else '❌'}",
+            "label": f"{result.label} {_LABEL_EMOJI.get(result.label, '❌')}",
             "explanations": [
                 {
                     "type": "analysis",
@@ -547,17 +794,17 @@ async def analyze_legacy(request: dict):
             ],
             "evidence_links": [
                 {
-                    "source": source.title,
-                    "url": source.url,
-                    "description": source.snippet
+                    "source": title,
+                    "url": source_url,
+                    "description": snippet
                 }
-                for source in result.sources[:3]
+                for title, source_url, snippet in map(_SOURCE_FIELDS, result.sources[:3])
             ]
         }
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Legacy endpoint error: {e}")
+        logger.error("Legacy endpoint error: %s", e)
         raise HTTPException(status_code=500, detail="Analysis failed")
 
 if __name__ == "__main__":